@@ -591,8 +591,8 @@ def get_dimension_bounds(
 
     if bounds is not None:
         try:
-            bounds_data = prefetch_dataset[list(bounds)[0]][:]
-        except IndexError:
+            bounds_data = prefetch_dataset[next(iter(bounds))][:]
+        except (IndexError, StopIteration):
             # The referred to variable in `bounds` can't be found in dataset
             bounds_data = None
     else:
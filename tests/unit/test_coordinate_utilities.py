@@ -1123,17 +1123,12 @@ class TestCoordinateUtilities(TestCase):
         are returned from a lat/lon prefetch dataset and
         crs provided.
         """
-        smap_varinfo = VarInfoFromDmr(
-            'tests/data/SC_SPL3SMP_008.dmr',
-            'SPL3SMP',
-            'hoss/hoss_config.json',
-        )
         smap_file_path = 'tests/data/SC_SPL3SMP_008_prefetch.nc4'
 
-        latitude_coordinate = smap_varinfo.get_variable(
+        latitude_coordinate = self.varinfo.get_variable(
             '/Soil_Moisture_Retrieval_Data_AM/latitude'
         )
-        longitude_coordinate = smap_varinfo.get_variable(
+        longitude_coordinate = self.varinfo.get_variable(
             '/Soil_Moisture_Retrieval_Data_AM/longitude'
         )
         projected_dimension_names_am = [
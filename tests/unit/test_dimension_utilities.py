@@ -57,6 +57,11 @@ class TestDimensionUtilities(TestCase):
         cls.ascending_dimension = masked_array(np.linspace(0, 200, 101))
         cls.descending_dimension = masked_array(np.linspace(200, 0, 101))
         cls.varinfo_with_bounds = VarInfoFromDmr('tests/data/GPM_3IMERGHH_example.dmr')
+        cls.smap_varinfo = VarInfoFromDmr(
+            'tests/data/SC_SPL3SMP_008.dmr',
+            'SPL3SMP',
+            config_file='hoss/hoss_config.json',
+        )
         cls.bounds_array = np.array(
             [
                 [90.0, 89.0],
@@ -438,16 +443,11 @@ class TestDimensionUtilities(TestCase):
             '/Soil_Moisture_Retrieval_Data_AM/albedo',
             '/Soil_Moisture_Retrieval_Data_AM/surface_flag',
         }
-        varinfo = VarInfoFromDmr(
-            'tests/data/SC_SPL3SMP_008.dmr',
-            'SPL3SMP',
-            config_file='hoss/hoss_config.json',
-        )
 
         self.assertEqual(
             get_prefetch_variables(
                 url,
-                varinfo,
+                self.smap_varinfo,
                 requested_variables,
                 output_dir,
                 self.logger,
@@ -460,7 +460,7 @@ class TestDimensionUtilities(TestCase):
             url, prefetch_variables, output_dir, self.logger, access_token, self.config
         )
         mock_check_add_artificial_bounds.assert_called_once_with(
-            prefetch_path, prefetch_variables, varinfo, self.logger
+            prefetch_path, prefetch_variables, self.smap_varinfo, self.logger
         )
 
     @patch('hoss.dimension_utilities.get_coordinate_variables')
@@ -487,17 +487,12 @@ class TestDimensionUtilities(TestCase):
             '/Soil_Moisture_Retrieval_Data_AM/albedo',
             '/Soil_Moisture_Retrieval_Data_AM/surface_flag',
         }
-        varinfo = VarInfoFromDmr(
-            'tests/data/SC_SPL3SMP_008.dmr',
-            'SPL3SMP',
-            config_file='hoss/hoss_config.json',
-        )
         with self.subTest('No coordinate variables'):
             mock_get_coordinate_variables.return_value = ([], [])
             with self.assertRaises(InvalidIndexSubsetRequest):
                 get_prefetch_variables(
                     url,
-                    varinfo,
+                    self.smap_varinfo,
                     requested_variables,
                     output_dir,
                     self.logger,
@@ -506,7 +501,7 @@ class TestDimensionUtilities(TestCase):
                 )
 
             mock_get_coordinate_variables.assert_called_once_with(
-                varinfo,
+                self.smap_varinfo,
                 requested_variables,
             )
             mock_get_opendap_nc4.assert_not_called()
@@ -524,7 +519,7 @@ class TestDimensionUtilities(TestCase):
             with self.assertRaises(InvalidIndexSubsetRequest):
                 get_prefetch_variables(
                     url,
-                    varinfo,
+                    self.smap_varinfo,
                     requested_variables,
                     output_dir,
                     self.logger,
@@ -533,7 +528,7 @@ class TestDimensionUtilities(TestCase):
                 )
 
             mock_get_coordinate_variables.assert_called_once_with(
-                varinfo,
+                self.smap_varinfo,
                 requested_variables,
             )
             mock_get_opendap_nc4.assert_not_called()
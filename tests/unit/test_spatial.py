@@ -30,6 +30,12 @@ class TestSpatial(TestCase):
             'tests/data/rssmif16d_example.dmr',
             config_file='tests/data/test_subsetter_config.json',
         )
+        cls.above_varinfo = VarInfoFromDmr('tests/data/ABoVE_TVPRM_example.dmr')
+        cls.smap_varinfo = VarInfoFromDmr(
+            'tests/data/SC_SPL3SMP_008.dmr',
+            'SPL3SMP',
+            'hoss/hoss_config.json',
+        )
         cls.test_dir = 'tests/output'
 
     def setUp(self):
@@ -45,12 +51,11 @@ class TestSpatial(TestCase):
 
         """
         harmony_message = Message({'subset': {'bbox': [-160, 68, -145, 70]}})
-        above_varinfo = VarInfoFromDmr('tests/data/ABoVE_TVPRM_example.dmr')
 
         self.assertDictEqual(
             get_spatial_index_ranges(
                 {'/NEE', '/x', '/y', '/time'},
-                above_varinfo,
+                self.above_varinfo,
                 'tests/data/ABoVE_TVPRM_prefetch.nc4',
                 harmony_message,
             ),
@@ -65,11 +70,6 @@ class TestSpatial(TestCase):
         """
         with self.subTest('Subset 2d SMAP L3'):
             harmony_message = Message({'subset': {'bbox': [2, 54, 42, 72]}})
-            smap_varinfo = VarInfoFromDmr(
-                'tests/data/SC_SPL3SMP_008.dmr',
-                'SPL3SMP',
-                'hoss/hoss_config.json',
-            )
             prefetch_path = 'tests/data/SC_SPL3SMP_009_prefetch.nc4'
             required_variables = {
                 '/Soil_Moisture_Retrieval_Data_AM/surface_flag',
@@ -87,7 +87,7 @@ class TestSpatial(TestCase):
             }
             index_ranges = get_spatial_index_ranges(
                 required_variables,
-                smap_varinfo,
+                self.smap_varinfo,
                 prefetch_path,
                 harmony_message,
             )
@@ -97,7 +97,7 @@ class TestSpatial(TestCase):
             )
         with self.subTest('Subset 3d SMAP L3'):
             harmony_message = Message({'subset': {'bbox': [2, 54, 42, 72]}})
-            smap_varinfo = VarInfoFromDmr(
+            smap_ftp_varinfo = VarInfoFromDmr(
                 'tests/data/SC_SPL3FTP_004.dmr',
                 'SPL3FTP',
                 'hoss/hoss_config.json',
@@ -116,7 +116,7 @@ class TestSpatial(TestCase):
             self.assertDictEqual(
                 get_spatial_index_ranges(
                     required_variables,
-                    smap_varinfo,
+                    smap_ftp_varinfo,
                     prefetch_path,
                     harmony_message,
                 ),
@@ -266,11 +266,6 @@ class TestSpatial(TestCase):
         a projected grid which is lambert_cylindrical_equal_area projection
 
         """
-        smap_varinfo = VarInfoFromDmr(
-            'tests/data/SC_SPL3SMP_008.dmr',
-            'SPL3SMP',
-            'hoss/hoss_config.json',
-        )
         smap_file_path = 'tests/data/SC_SPL3SMP_008_prefetch.nc4'
         expected_index_ranges = {
             '/Soil_Moisture_Retrieval_Data_AM/dim_x': (487, 595),
@@ -278,10 +273,10 @@ class TestSpatial(TestCase):
         }
         bbox = BBox(2, 54, 42, 72)
 
-        latitude_coordinate = smap_varinfo.get_variable(
+        latitude_coordinate = self.smap_varinfo.get_variable(
             '/Soil_Moisture_Retrieval_Data_AM/latitude'
         )
-        longitude_coordinate = smap_varinfo.get_variable(
+        longitude_coordinate = self.smap_varinfo.get_variable(
             '/Soil_Moisture_Retrieval_Data_AM/longitude'
         )
 
@@ -314,7 +309,7 @@ class TestSpatial(TestCase):
                 self.assertDictEqual(
                     get_x_y_index_ranges_from_coordinates(
                         '/Soil_Moisture_Retrieval_Data_AM/surface_flag',
-                        smap_varinfo,
+                        self.smap_varinfo,
                         smap_prefetch,
                         latitude_coordinate,
                         longitude_coordinate,
@@ -355,7 +350,7 @@ class TestSpatial(TestCase):
                 self.assertDictEqual(
                     get_x_y_index_ranges_from_coordinates(
                         '/Soil_Moisture_Retrieval_Data_AM/surface_flag',
-                        smap_varinfo,
+                        self.smap_varinfo,
                         smap_prefetch,
                         latitude_coordinate,
                         longitude_coordinate,
@@ -383,7 +378,6 @@ class TestSpatial(TestCase):
         with data in Alaska.
 
         """
-        above_varinfo = VarInfoFromDmr('tests/data/ABoVE_TVPRM_example.dmr')
         above_file_path = 'tests/data/ABoVE_TVPRM_prefetch.nc4'
         expected_index_ranges = {'/x': (37, 56), '/y': (7, 26)}
         bbox = BBox(-160, 68, -145, 70)
@@ -419,7 +413,11 @@ class TestSpatial(TestCase):
             with Dataset(above_file_path, 'r') as above_prefetch:
                 self.assertDictEqual(
                     get_projected_x_y_index_ranges(
-                        '/NEE', above_varinfo, above_prefetch, {}, bounding_box=bbox
+                        '/NEE',
+                        self.above_varinfo,
+                        above_prefetch,
+                        {},
+                        bounding_box=bbox,
                     ),
                     expected_index_ranges,
                 )
@@ -469,7 +467,7 @@ class TestSpatial(TestCase):
             with Dataset(above_file_path, 'r') as above_prefetch:
                 self.assertDictEqual(
                     get_projected_x_y_index_ranges(
-                        '/x', above_varinfo, above_prefetch, {}, bounding_box=bbox
+                        '/x', self.above_varinfo, above_prefetch, {}, bounding_box=bbox
                     ),
                     {},
                 )
@@ -482,7 +480,7 @@ class TestSpatial(TestCase):
                 self.assertDictEqual(
                     get_projected_x_y_index_ranges(
                         '/NEE',
-                        above_varinfo,
+                        self.above_varinfo,
                         above_prefetch,
                         expected_index_ranges,
                         bounding_box=bbox,
@@ -1,5 +1,5 @@
 import shutil
-from logging import Logger
+from logging import getLogger
 from tempfile import mkdtemp
 from unittest import TestCase
 from unittest.mock import call, patch
@@ -31,7 +31,7 @@ class TestSubset(TestCase):
         cls.config = config(validate=False)
         cls.collection_short_name = 'RSSMIF16D'
         cls.granule_url = 'https://harmony.earthdata.nasa.gov/bucket/rssmif16d'
-        cls.logger = Logger('tests')
+        cls.logger = getLogger('tests')
         cls.output_path = 'f16_ssmis_subset.nc4'
         cls.required_variables = {'/latitude', '/longitude', '/time', '/rainfall_rate'}
         cls.harmony_source = Source(
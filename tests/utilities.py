@@ -10,6 +10,11 @@ from pystac import Asset, Catalog, Item
 
 Granule = namedtuple('Granule', ['url', 'media_type', 'roles'])
 
+# Shared by every STAC item created by `create_stac`, so must not be mutated.
+GLOBAL_BBOX = [-180, -90, 180, 90]
+GLOBAL_GEOMETRY = bbox_to_geometry(GLOBAL_BBOX)
+GLOBAL_DATETIME = datetime(2020, 1, 1)
+
 
 def write_dmr(output_dir: str, content: str):
     """A helper function to write out the content of a `.dmr`, when the
@@ -81,9 +86,9 @@ def create_stac(granules: List[Granule]) -> Catalog:
     for granule_index, granule in enumerate(granules):
         item = Item(
             id=f'granule_{granule_index}',
-            geometry=bbox_to_geometry([-180, -90, 180, 90]),
-            bbox=[-180, -90, 180, 90],
-            datetime=datetime(2020, 1, 1),
+            geometry=GLOBAL_GEOMETRY,
+            bbox=GLOBAL_BBOX,
+            datetime=GLOBAL_DATETIME,
             properties=None,
         )
         item.add_asset(